@@ -7,20 +7,127 @@ Base stable: bass, drums, other stems
 Vocals: change based on crowd energy/movement feedback
 """
 
+import os
 import threading
 import time
 import random
-import json
+import orjson
 import numpy as np
 import librosa
+import soundfile as sf
+import soxr
 from pathlib import Path
 import pyaudio
 from pythonosc import dispatcher
 from pythonosc.osc_server import ThreadingOSCUDPServer
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from config_loader import ConfigLoader
 
+# Numba JIT for the real-time buffer reads (optional - can be heavy to build
+# on Raspberry Pi; the mixer falls back to pure NumPy without it)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+# Optional high-quality stretchers for load-time BPM matching. Rubberband
+# sounds noticeably better than librosa's phase vocoder on full stems;
+# pedalboard ships the same engine without the rubberband-cli dependency.
+try:
+    import pyrubberband
+    PYRUBBERBAND_AVAILABLE = True
+except ImportError:
+    pyrubberband = None
+    PYRUBBERBAND_AVAILABLE = False
+
+try:
+    from pedalboard import time_stretch as pedalboard_time_stretch
+    PEDALBOARD_AVAILABLE = True
+except ImportError:
+    pedalboard_time_stretch = None
+    PEDALBOARD_AVAILABLE = False
+
+# Stems are stored as int16 (2 bytes/sample instead of 4) and scaled back to
+# float in the mix kernels - halves the memory bandwidth of the mix loop and
+# the RAM footprint of the stem caches
+INT16_SCALE = 32767.0
+
+# A phase-vocoder stretch is NOT a no-op at rate 1.0 - the STFT round trip
+# alone smears transients - so rates within this deadband always play the
+# raw audio, regardless of the configured time_stretch_threshold
+TIME_STRETCH_DEADBAND = 0.02
+
+
+def _float_to_int16(audio_data: np.ndarray) -> np.ndarray:
+    """Quantize float32 audio in [-1, 1] to int16 storage"""
+    return np.clip(audio_data * INT16_SCALE, -32768, 32767).astype(np.int16)
+
+
+def _int16_to_float(audio_data: np.ndarray) -> np.ndarray:
+    """Expand int16 storage back to float32 in [-1, 1] (for offline DSP)"""
+    return audio_data.astype(np.float32) / INT16_SCALE
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a song/structure name for index lookups"""
+    return name.strip().lower()
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, boundscheck=False)
+    def _read_loop(audio_data, position, num_samples, volume, out):
+        """Ring-buffer read fused with the volume scale
+
+        Writes num_samples into the preallocated out buffer, wrapping around
+        the end of audio_data, and returns the new read position. Compiled
+        with Numba so the per-callback copy has no interpreter overhead and
+        no temporary allocations.
+        """
+        n = audio_data.shape[0]
+        for i in range(num_samples):
+            out[i] = audio_data[(position + i) % n] * volume
+        return (position + num_samples) % n
+
+    @numba.njit(cache=True, parallel=True, fastmath=True, boundscheck=False)
+    def _mix_kernel(stem_arrays, positions, lengths, volumes, master_vol, out):
+        """Fused mix: ring-buffer reads + volume + master scale + soft limit
+
+        One pass over the output buffer instead of one NumPy pass per stem
+        plus separate scale/abs/tanh passes. Returns the pre-limit peak;
+        positions is updated in place with the new read offsets.
+        """
+        num_stems = len(stem_arrays)
+        frame_count = out.shape[0]
+
+        peak = 0.0
+        for i in numba.prange(frame_count):
+            sample = 0.0
+            for k in range(num_stems):
+                sample += (stem_arrays[k][(positions[k] + i) % lengths[k]]
+                           * volumes[k])
+            sample *= master_vol
+            peak = max(peak, abs(sample))
+            out[i] = sample
+
+        # Soft limiting with the cubic x - x³/3 (tanh's Taylor expansion,
+        # ~5x cheaper per sample and equivalent for |x| <= 1 after the
+        # peak normalization; same curve as the NumPy path)
+        if peak > 0.8:
+            inv_peak = 1.0 / peak
+            for i in numba.prange(frame_count):
+                x = out[i] * inv_peak
+                out[i] = (x - x * x * x / 3.0) * 0.8
+
+        for k in range(num_stems):
+            positions[k] = (positions[k] + frame_count) % lengths[k]
+
+        return peak
+
 @dataclass
 class Song:
     """Song metadata"""
@@ -31,7 +138,11 @@ class Song:
 
 @dataclass
 class StemPlayer:
-    """Individual stem player with real-time controls"""
+    """Individual stem player with real-time controls
+
+    audio_data is int16 storage (see INT16_SCALE); the read kernels fold the
+    int16->float conversion into the per-stem volume scale.
+    """
     name: str
     audio_data: np.ndarray
     sample_rate: int
@@ -40,85 +151,108 @@ class StemPlayer:
     position: int = 0
     playing: bool = True
     loop: bool = True
+    # Pre-stretched audio per target BPM - filled off the audio thread so the
+    # callback never has to run a phase vocoder (too heavy for real-time)
+    _stretched_cache: Dict[float, np.ndarray] = field(default_factory=dict, repr=False)
+    # Preallocated output buffer reused every callback (no per-chunk malloc)
+    _out_buf: Optional[np.ndarray] = field(default=None, repr=False)
+    # Cached arange for the wrap-around gather in the NumPy fallback path
+    _idx_scratch: Optional[np.ndarray] = field(default=None, repr=False)
+
+    @staticmethod
+    def _bpm_key(target_bpm: float) -> float:
+        """Bucket target BPM to 0.5 steps so near-identical targets share a buffer"""
+        return round(target_bpm * 2.0) / 2.0
+
+    def prepare_bpm(self, target_bpm: float, config=None):
+        """Pre-compute a time-stretched copy for target_bpm (call off the audio thread)
+
+        Time-stretch changes tempo while preserving pitch. Doing it once per
+        (stem, target BPM) instead of once per callback chunk turns the hot
+        path into a plain buffer read.
+        """
+        if len(self.audio_data) == 0 or self.original_bpm <= 0:
+            return
+
+        key = self._bpm_key(target_bpm)
+        if key in self._stretched_cache:
+            return
+
+        playback_rate = key / self.original_bpm
+
+        # Small rate changes aren't worth a stretch - play raw at rate 1
+        # (and never stretch within the deadband: a rate~1 stretch only
+        # degrades the signal, see TIME_STRETCH_DEADBAND)
+        threshold = config.audio.time_stretch_threshold if config else TIME_STRETCH_DEADBAND
+        if abs(playback_rate - 1.0) <= max(threshold, TIME_STRETCH_DEADBAND):
+            self._stretched_cache[key] = self.audio_data
+            return
+
+        try:
+            # 40ms frames follow the tempo better than librosa's 2048 default
+            n_fft = int(0.04 * self.sample_rate)
+            stretched = librosa.effects.time_stretch(
+                _int16_to_float(self.audio_data),
+                rate=playback_rate,
+                n_fft=n_fft
+            )
+            self._stretched_cache[key] = _float_to_int16(stretched)
+        except Exception:
+            # Fallback: play raw audio at its native tempo
+            self._stretched_cache[key] = self.audio_data
+
+    def active_buffer(self, target_bpm: float) -> np.ndarray:
+        """Audio buffer to play for target_bpm (pre-stretched when available)
+
+        Pre-stretched audio plays at rate 1; falls back to the raw stem if
+        the cache entry isn't ready yet.
+        """
+        return self._stretched_cache.get(self._bpm_key(target_bpm), self.audio_data)
 
     def get_samples(self, num_samples: int, target_bpm: float, config=None) -> np.ndarray:
-        """Get samples with real-time BPM adjustment"""
+        """Get samples from the pre-stretched buffer (pure copy, real-time safe)"""
         if not self.playing or len(self.audio_data) == 0:
             return np.zeros(num_samples, dtype=np.float32)
 
-        # Calculate playback rate for BPM change
-        playback_rate = target_bpm / self.original_bpm if self.original_bpm > 0 else 1.0
+        audio = self.active_buffer(target_bpm)
 
-        # Adjust sample count based on playback rate
-        source_samples_needed = int(num_samples * playback_rate)
+        # Cache swaps can leave position past the end of a shorter buffer
+        position = self.position % len(audio)
 
-        # Get samples from current position
-        if self.position + source_samples_needed <= len(self.audio_data):
-            samples = self.audio_data[self.position:self.position + source_samples_needed]
-            self.position += source_samples_needed
-        else:
-            # Handle end of audio - loop
-            if self.loop:
-                remaining = len(self.audio_data) - self.position
-                first_part = self.audio_data[self.position:] if remaining > 0 else np.array([], dtype=np.float32)
+        # Volume scale with the int16->float expansion folded in
+        gain = np.float32(self.volume / INT16_SCALE)
 
-                # Reset position and get rest
-                loops_needed = (source_samples_needed - len(first_part)) // len(self.audio_data) + 1
-                second_part = np.tile(self.audio_data, loops_needed)[:source_samples_needed - len(first_part)]
+        # Fast path: JIT-compiled ring-buffer read into the reused buffer
+        if NUMBA_AVAILABLE and self.loop:
+            out = self._out_buf
+            if out is None or len(out) != num_samples:
+                out = self._out_buf = np.zeros(num_samples, dtype=np.float32)
+            self.position = _read_loop(audio, position, num_samples, gain, out)
+            return out
 
-                samples = np.concatenate([first_part, second_part]) if len(first_part) > 0 else second_part
-                self.position = len(second_part)
-            else:
-                samples = np.zeros(source_samples_needed, dtype=np.float32)
-
-        # Apply time-stretching based on configuration
-        if config and config.audio.enable_time_stretching:
-            # Only time-stretch if change is significant
-            if abs(playback_rate - 1.0) > config.audio.time_stretch_threshold:
-                try:
-                    # Time-stretch: changes tempo, preserves pitch
-                    if config.performance.high_quality_time_stretch:
-                        samples = librosa.effects.time_stretch(
-                            samples,
-                            rate=1.0/playback_rate,
-                            hop_length=config.performance.hop_length
-                        )
-                    else:
-                        samples = librosa.effects.time_stretch(samples, rate=1.0/playback_rate)
-                except Exception as e:
-                    # Fallback: simple resampling
-                    pass
+        # NumPy fallback: get samples from current position
+        if position + num_samples <= len(audio):
+            samples = audio[position:position + num_samples]
+            self.position = position + num_samples
         else:
-            # No time-stretching: simple playback rate change (changes both tempo AND pitch)
-            # This is like playing a vinyl record faster/slower
-            pass
-
-        # Apply pitch shifting if enabled
-        if config and config.audio.enable_pitch_shifting:
-            if config.audio.max_pitch_shift_semitones > 0:
-                try:
-                    # Calculate semitones based on playback rate
-                    # Note: this is optional and based on musical key matching
-                    semitones = 12 * np.log2(playback_rate)
-                    semitones = np.clip(semitones, -config.audio.max_pitch_shift_semitones,
-                                       config.audio.max_pitch_shift_semitones)
-                    samples = librosa.effects.pitch_shift(
-                        samples,
-                        sr=self.sample_rate,
-                        n_steps=semitones
-                    )
-                except Exception as e:
-                    pass
+            # Handle end of audio - loop via modular indexing (a chunk-sized
+            # gather instead of tiling whole copies of the stem)
+            if self.loop:
+                idx = self._idx_scratch
+                if idx is None or len(idx) != num_samples:
+                    idx = self._idx_scratch = np.arange(num_samples, dtype=np.int64)
+                samples = np.take(audio, idx + position, mode='wrap')
+                self.position = (position + num_samples) % len(audio)
+            else:
+                samples = np.zeros(num_samples, dtype=np.float32)
+                self.position = position
 
         # Ensure exact output length
         if len(samples) != num_samples:
-            if len(samples) > num_samples:
-                samples = samples[:num_samples]
-            else:
-                samples = np.pad(samples, (0, num_samples - len(samples)))
+            samples = np.pad(samples, (0, num_samples - len(samples)))
 
-        # Apply volume
-        return samples * self.volume
+        # Apply volume (also expands int16 storage back to float)
+        return samples * gain
 
 
 class EnergyResponsivePerformance:
@@ -150,6 +284,10 @@ class EnergyResponsivePerformance:
         self.pyaudio = pyaudio.PyAudio()
         self.audio_stream = None
 
+        # Preallocated callback buffers - the audio callback must not malloc
+        self._mix_buf = np.zeros(self.chunk_size, dtype=np.float32)
+        self._abs_scratch = np.zeros(self.chunk_size, dtype=np.float32)
+
         # Directories
         self.stems_dir = Path(stems_dir)
         self.structures_dir = Path(structures_dir)
@@ -157,13 +295,35 @@ class EnergyResponsivePerformance:
         # Performance state
         self.base_bpm = base_bpm
         self.current_energy = 0.5  # 0.0 = no movement, 1.0 = high energy
+        # Latest raw energy from OSC - a single slot overwritten per message
+        # and sampled by the performance loop, so bursts coalesce for free
+        self._energy_slot = self.current_energy
+        self._last_energy_print = 0.0
         self.energy_threshold_low = 0.3  # Below this = low energy
         self.energy_threshold_high = 0.7  # Above this = high energy
         self.master_volume = self.config.audio.master_volume
+        # Serializes writers only - the audio callback never takes this lock
         self.settings_lock = threading.Lock()
+        # Immutable snapshot read lock-free by the audio callback:
+        # (base_bpm, master_volume, base stem players, current vocal,
+        #  prebuilt SoA mix view for the Numba kernel or None)
+        self._state = (self.base_bpm, np.float32(self.master_volume), (), None, None)
 
         # Track management
         self.songs: Dict[str, Song] = {}
+        # Decoded/resampled stem audio keyed by (song, stem type) so repeated
+        # vocal rotations don't re-read the same WAV from disk
+        self._stem_cache: Dict[Tuple[str, str], np.ndarray] = {}
+        # Load-time stretched audio keyed by (song, stem type, BPM bucket)
+        self._stretched_stem_cache: Dict[Tuple[str, str, float], np.ndarray] = {}
+        # Ready-built players keyed by (song, stem type) - a vocal that was
+        # playing 30s ago comes back as a clone instead of a rebuild. Evicting
+        # an entry also drops its backing audio from the caches above.
+        self._stem_lru: "OrderedDict[Tuple[str, str], StemPlayer]" = OrderedDict()
+        self.stem_lru_size = 16  # ~500MB of int16 stems
+        # Guards the three caches above - _load_stem runs concurrently on the
+        # prefetch, performance and OSC threads
+        self._cache_lock = threading.Lock()
         self._load_songs()
         self.available_songs = list(self.songs.keys())
         self.vocal_tracks = []  # Songs available for vocal rotation
@@ -172,6 +332,15 @@ class EnergyResponsivePerformance:
         self.base_stems: Dict[str, StemPlayer] = {}  # bass, drums, other
         self.current_vocal: Optional[StemPlayer] = None
         self.current_vocal_song_name = None
+
+        # Prefetched vocal players ready to swap in (filled by _prefetch_loop)
+        self._vocal_pool: Dict[str, StemPlayer] = {}
+        self._pool_lock = threading.Lock()
+        self.vocal_pool_size = 3
+
+        # Memoized BPM-compatible vocal lists keyed by int(base_bpm) - the
+        # base BPM changes rarely, so don't rescan all songs on every change
+        self._compat_cache: Dict[int, List[str]] = {}
         self.vocal_repeat_count = 0
         self.max_vocal_repeats = 2
 
@@ -194,6 +363,7 @@ class EnergyResponsivePerformance:
         # Performance thread
         self.running = False
         self.performance_thread = threading.Thread(target=self._performance_loop, daemon=True)
+        self.prefetch_thread = threading.Thread(target=self._prefetch_loop, daemon=True)
 
         print(f"🎭🔥 ENERGY-RESPONSIVE EUROVISION PERFORMANCE 🔥🎭")
         print(f"🎵 Songs Available: {len(self.available_songs)}")
@@ -210,28 +380,42 @@ class EnergyResponsivePerformance:
         """Load song information from stems directory and structures"""
         print("🎵 Loading song library...")
 
-        # Load structure JSON files
+        # Parse structure JSON files in parallel with orjson - large song
+        # libraries otherwise stall startup on serial open/parse
+        def parse_structure(json_file):
+            try:
+                data = orjson.loads(json_file.read_bytes())
+
+                sections = []
+                for seg in data.get('segments', []):
+                    sections.append({
+                        'start': seg['start'],
+                        'end': seg['end'],
+                        'label': seg['label']
+                    })
+
+                return json_file.stem, {
+                    'bpm': data.get('bpm', 120),
+                    'sections': sections
+                }
+            except Exception:
+                return None  # Skip invalid files
+
         song_structures = {}
         if self.structures_dir.exists():
-            for json_file in self.structures_dir.glob("*.json"):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-
-                    sections = []
-                    for seg in data.get('segments', []):
-                        sections.append({
-                            'start': seg['start'],
-                            'end': seg['end'],
-                            'label': seg['label']
-                        })
-
-                    song_structures[json_file.stem] = {
-                        'bpm': data.get('bpm', 120),
-                        'sections': sections
-                    }
-                except Exception as e:
-                    pass  # Skip invalid files
+            json_files = list(self.structures_dir.glob("*.json"))
+            if json_files:
+                with ThreadPoolExecutor() as executor:
+                    for parsed in executor.map(parse_structure, json_files):
+                        if parsed:
+                            song_structures[parsed[0]] = parsed[1]
+
+        # Structures are normally named after the song directory, so index
+        # them by normalized name - a dict lookup per song instead of an
+        # O(songs x structures) substring scan
+        structures_by_key = {
+            _normalize_name(name): data for name, data in song_structures.items()
+        }
 
         # Load song directories
         if self.stems_dir.exists():
@@ -240,18 +424,25 @@ class EnergyResponsivePerformance:
                     stem_files = {}
                     stem_types = ['bass', 'drums', 'vocals', 'piano', 'other']
 
+                    # One scandir per song instead of a stat per stem type
+                    try:
+                        dir_entries = {entry.name for entry in os.scandir(song_dir)}
+                    except OSError:
+                        continue
+
                     for stem_type in stem_types:
-                        stem_file = song_dir / f"{stem_type}.wav"
-                        if stem_file.exists():
-                            stem_files[stem_type] = stem_file
+                        if f"{stem_type}.wav" in dir_entries:
+                            stem_files[stem_type] = song_dir / f"{stem_type}.wav"
 
                     if len(stem_files) >= 2:
                         # Find matching structure
-                        structure = None
-                        for struct_name, struct_data in song_structures.items():
-                            if song_dir.name in struct_name:
-                                structure = struct_data
-                                break
+                        structure = structures_by_key.get(_normalize_name(song_dir.name))
+                        if structure is None:
+                            # Rare: structure name carries a prefix/suffix
+                            for struct_name, struct_data in song_structures.items():
+                                if song_dir.name in struct_name:
+                                    structure = struct_data
+                                    break
 
                         bpm = structure['bpm'] if structure else 120.0
                         sections = structure['sections'] if structure else []
@@ -330,10 +521,18 @@ class EnergyResponsivePerformance:
                         print(f"  ✅ {stem_type}: {song.name.split('(')[0].strip()} (BPM: {song.bpm:.0f}, diff: {bpm_diff:.1f}%)")
                         break
 
+        self._publish_state()
         print(f"✅ Loaded {len(self.base_stems)} base stems")
 
-    def _load_stem(self, song_name: str, stem_type: str) -> Optional[StemPlayer]:
-        """Load a single stem from a song"""
+    def _load_stem(self, song_name: str, stem_type: str,
+                   resample_quality: str = 'HQ') -> Optional[StemPlayer]:
+        """Load a single stem from a song
+
+        resample_quality is passed to soxr when the file rate differs from
+        the mixer rate ('QQ' trades fidelity for speed on latency-sensitive
+        paths like the background prefetcher). Decoded audio is cached per
+        (song, stem type), so the first load's quality wins on cache hits.
+        """
         if song_name not in self.songs:
             return None
 
@@ -342,42 +541,104 @@ class EnergyResponsivePerformance:
         if stem_type not in song.stem_files:
             return None
 
+        # Reuse a recently built player if we have one - return a rewound
+        # clone (shared audio buffers, private position/scratch) rather than
+        # mutating the cached instance
+        lru_key = (song_name, stem_type)
+        with self._cache_lock:
+            cached_player = self._stem_lru.get(lru_key)
+            if cached_player is not None:
+                self._stem_lru.move_to_end(lru_key)
+                return replace(cached_player, position=0,
+                               _out_buf=None, _idx_scratch=None)
+
         try:
-            # Load audio file
-            audio_data, sr = librosa.load(
-                song.stem_files[stem_type],
-                sr=self.sample_rate,
-                mono=True,
-                dtype=np.float32
-            )
+            # Stems are plain WAVs - decode directly with soundfile instead of
+            # going through librosa/audioread, and reuse already-decoded audio
+            cache_key = (song_name, stem_type)
+            with self._cache_lock:
+                audio_data = self._stem_cache.get(cache_key)
+
+            if audio_data is None:
+                audio_data, sr = sf.read(
+                    str(song.stem_files[stem_type]), dtype='float32', always_2d=False
+                )
+                if audio_data.ndim > 1:
+                    audio_data = audio_data.mean(axis=1, dtype=np.float32)
+                if sr != self.sample_rate:
+                    # soxr is much faster than librosa's resampy path
+                    audio_data = soxr.resample(audio_data, sr, self.sample_rate,
+                                               quality=resample_quality)
+                # Quantize to int16 - half the cache footprint and mix bandwidth
+                audio_data = _float_to_int16(np.asarray(audio_data, dtype=np.float32))
+                with self._cache_lock:
+                    self._stem_cache[cache_key] = audio_data
+
+            # Stretch the stem to the base BPM once, here, so the audio
+            # callback always plays at rate 1 and never touches a stretcher
+            original_bpm = song.bpm
+            if (self.config.audio.enable_time_stretching and song.bpm > 0):
+                playback_rate = self.base_bpm / song.bpm
+                stretch_threshold = max(self.config.audio.time_stretch_threshold,
+                                        TIME_STRETCH_DEADBAND)
+                if abs(playback_rate - 1.0) > stretch_threshold:
+                    stretch_key = (song_name, stem_type, StemPlayer._bpm_key(self.base_bpm))
+                    with self._cache_lock:
+                        stretched = self._stretched_stem_cache.get(stretch_key)
+                    if stretched is None:
+                        stretched = self._stretch_to_bpm(audio_data, song.bpm, self.base_bpm)
+                        if stretched is not None:
+                            with self._cache_lock:
+                                self._stretched_stem_cache[stretch_key] = stretched
+                    # Only relabel the stem as BPM-matched if a stretcher
+                    # actually ran; otherwise keep the native BPM so
+                    # prepare_bpm computes rates from the right base
+                    if stretched is not None:
+                        audio_data = stretched
+                        original_bpm = self.base_bpm
 
             # Create stem player
             volume = self.config.mixing.stem_volumes.get(stem_type, 0.8)
             stem_player = StemPlayer(
                 name=f"{song.name}_{stem_type}",
                 audio_data=audio_data,
-                sample_rate=sr,
-                original_bpm=song.bpm,
+                sample_rate=self.sample_rate,
+                original_bpm=original_bpm,
                 volume=volume
             )
 
+            # Register the buffer for the current BPM so the callback lookup hits
+            if self.config.audio.enable_time_stretching:
+                stem_player.prepare_bpm(self.base_bpm, self.config)
+
+            with self._cache_lock:
+                self._stem_lru[lru_key] = stem_player
+                while len(self._stem_lru) > self.stem_lru_size:
+                    old_key, _ = self._stem_lru.popitem(last=False)
+                    # Drop the backing audio too, or eviction frees nothing
+                    self._stem_cache.pop(old_key, None)
+                    for stale_key in [k for k in self._stretched_stem_cache
+                                      if k[:2] == old_key]:
+                        del self._stretched_stem_cache[stale_key]
+
             return stem_player
 
         except Exception as e:
             print(f"❌ Error loading {stem_type} from {song_name}: {e}")
             return None
 
-    def _change_vocal(self, force: bool = False):
-        """Change vocal track"""
-        if not self.vocal_tracks:
-            return
+    def _compatible_vocals(self, verbose: bool = False) -> List[str]:
+        """Find vocal tracks BPM-compatible with the current base BPM
 
-        # Check minimum duration
-        time_since_change = time.time() - self.last_vocal_change
-        if not force and time_since_change < self.min_vocal_duration:
-            return
+        Prefers ±10% to avoid distortion, widening to ±20% and finally all
+        vocal tracks if nothing matches. Results are memoized per integer
+        BPM bucket and sorted by BPM distance.
+        """
+        cache_key = int(self.base_bpm)
+        cached = self._compat_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Find compatible vocals (BPM ±10% to avoid distortion)
         bpm_tolerance = 0.10  # 10% tolerance
         compatible = []
         for song_name in self.vocal_tracks:
@@ -386,8 +647,9 @@ class EnergyResponsivePerformance:
                 compatible.append(song_name)
 
         if not compatible:
-            print(f"⚠️  No compatible vocals at {self.base_bpm} BPM (±{bpm_tolerance*100:.0f}%)")
-            print(f"   Using wider tolerance (may have pitch changes)")
+            if verbose:
+                print(f"⚠️  No compatible vocals at {self.base_bpm} BPM (±{bpm_tolerance*100:.0f}%)")
+                print(f"   Using wider tolerance (may have pitch changes)")
             # Fallback to wider tolerance
             for song_name in self.vocal_tracks:
                 song = self.songs[song_name]
@@ -397,6 +659,95 @@ class EnergyResponsivePerformance:
             if not compatible:
                 compatible = self.vocal_tracks.copy()
 
+        compatible.sort(key=lambda s: abs(self.songs[s].bpm - self.base_bpm))
+        self._compat_cache[cache_key] = compatible
+        return compatible
+
+    def _prefetch_loop(self):
+        """Keep a small pool of ready-to-play vocals loaded in the background
+
+        _change_vocal runs on the performance thread, so a synchronous disk
+        load there stalls the show. This loop fills a pool of pre-loaded
+        StemPlayers so the actual swap is just a reference assignment.
+        """
+        while self.running:
+            try:
+                candidates = [
+                    s for s in self._compatible_vocals()
+                    if s != self.current_vocal_song_name
+                ]
+
+                with self._pool_lock:
+                    needed = self.vocal_pool_size - len(self._vocal_pool)
+                    to_load = [s for s in candidates if s not in self._vocal_pool]
+
+                if needed > 0 and to_load:
+                    for song_name in random.sample(to_load, min(needed, len(to_load))):
+                        # Fast resample quality - keep the prefetcher cheap
+                        stem_player = self._load_stem(song_name, 'vocals',
+                                                      resample_quality='QQ')
+                        if stem_player:
+                            with self._pool_lock:
+                                self._vocal_pool[song_name] = stem_player
+                                # Evict oldest entries beyond the pool size
+                                while len(self._vocal_pool) > self.vocal_pool_size:
+                                    self._vocal_pool.pop(next(iter(self._vocal_pool)))
+
+            except Exception as e:
+                print(f"❌ Vocal prefetch error: {e}")
+
+            time.sleep(2.0)
+
+    def _stretch_to_bpm(self, audio_data: np.ndarray, from_bpm: float,
+                        to_bpm: float) -> Optional[np.ndarray]:
+        """Time-stretch a whole stem from from_bpm to to_bpm (offline, load time)
+
+        Prefers rubberband (best quality), then pedalboard, then librosa's
+        phase vocoder with 40ms analysis frames. Each stretcher that fails
+        falls through to the next - importing pyrubberband succeeds even when
+        the rubberband CLI binary is missing, so import success alone proves
+        nothing. Takes and returns int16 stem storage; the DSP itself runs in
+        float32. Returns None if every stretcher fails.
+        """
+        rate = to_bpm / from_bpm
+        audio_f32 = _int16_to_float(audio_data)
+
+        if PYRUBBERBAND_AVAILABLE:
+            try:
+                stretched = pyrubberband.time_stretch(audio_f32, self.sample_rate, rate)
+                return _float_to_int16(np.asarray(stretched, dtype=np.float32))
+            except Exception as e:
+                print(f"⚠️  rubberband stretch failed, trying next stretcher: {e}")
+
+        if PEDALBOARD_AVAILABLE:
+            try:
+                stretched = pedalboard_time_stretch(
+                    audio_f32, self.sample_rate, stretch_factor=rate
+                ).reshape(-1)
+                return _float_to_int16(np.asarray(stretched, dtype=np.float32))
+            except Exception as e:
+                print(f"⚠️  pedalboard stretch failed, trying next stretcher: {e}")
+
+        try:
+            n_fft = int(0.04 * self.sample_rate)
+            stretched = librosa.effects.time_stretch(audio_f32, rate=rate, n_fft=n_fft)
+            return _float_to_int16(np.asarray(stretched, dtype=np.float32))
+        except Exception as e:
+            print(f"⚠️  Time stretch failed ({from_bpm:.0f}→{to_bpm:.0f} BPM): {e}")
+            return None
+
+    def _change_vocal(self, force: bool = False):
+        """Change vocal track"""
+        if not self.vocal_tracks:
+            return
+
+        # Check minimum duration
+        time_since_change = time.time() - self.last_vocal_change
+        if not force and time_since_change < self.min_vocal_duration:
+            return
+
+        compatible = self._compatible_vocals(verbose=True)
+
         # Select random vocal (avoid current)
         available = [s for s in compatible if s != self.current_vocal_song_name]
         if not available:
@@ -404,12 +755,18 @@ class EnergyResponsivePerformance:
 
         new_vocal_song_name = random.choice(available)
 
-        # Load new vocal
-        new_vocal = self._load_stem(new_vocal_song_name, 'vocals')
+        # Take a prefetched player if available - the swap is then instant
+        with self._pool_lock:
+            new_vocal = self._vocal_pool.pop(new_vocal_song_name, None)
+
+        if new_vocal is None:
+            new_vocal = self._load_stem(new_vocal_song_name, 'vocals')
+
         if new_vocal:
             with self.settings_lock:
                 self.current_vocal = new_vocal
                 self.current_vocal_song_name = new_vocal_song_name
+                self._publish_state()
 
             self.last_vocal_change = time.time()
             self.vocal_repeat_count = 0
@@ -424,40 +781,118 @@ class EnergyResponsivePerformance:
         print("⚡ Forcing vocal change...")
         self._change_vocal(force=True)
 
+    def _build_mix_view(self):
+        """Build the structure-of-arrays view consumed by the mix kernel
+
+        Flattens the active StemPlayer objects into parallel arrays (audio
+        buffers, positions, lengths, volumes) once here, on the control
+        path, so the callback passes them straight to _mix_kernel instead
+        of walking Python objects every chunk. Returns None when the kernel
+        can't be used (no Numba, no stems, or a non-looping player).
+        """
+        players = [
+            p for p in self.base_stems.values()
+            if p.playing and len(p.audio_data) > 0
+        ]
+        if (self.current_vocal and self.current_vocal.playing
+                and len(self.current_vocal.audio_data) > 0):
+            players.append(self.current_vocal)
+
+        if not (NUMBA_AVAILABLE and players and all(p.loop for p in players)):
+            return None
+
+        num_stems = len(players)
+        arrays = numba.typed.List()
+        positions = np.empty(num_stems, dtype=np.int64)
+        lengths = np.empty(num_stems, dtype=np.int64)
+        volumes = np.empty(num_stems, dtype=np.float32)
+
+        for k, player in enumerate(players):
+            audio = player.active_buffer(self.base_bpm)
+            arrays.append(audio)
+            positions[k] = player.position % len(audio)
+            lengths[k] = len(audio)
+            # Fold the int16->float expansion into the stem volume
+            volumes[k] = player.volume / INT16_SCALE
+
+        return (tuple(players), arrays, positions, lengths, volumes)
+
+    def _publish_state(self):
+        """Publish an immutable settings snapshot for the audio callback
+
+        Writers build a fresh tuple and swap it in with a single attribute
+        assignment (atomic in CPython), so the audio thread never has to
+        take settings_lock - no contention or priority inversion there.
+        """
+        self._state = (
+            self.base_bpm,
+            np.float32(self.master_volume),  # float32 scalar: no upcast in the mix
+            tuple(self.base_stems.values()),
+            self.current_vocal,
+            self._build_mix_view(),
+        )
+
     def audio_callback(self, in_data, frame_count, time_info, status):
         """Real-time audio callback"""
         try:
-            with self.settings_lock:
-                current_bpm = self.base_bpm
-                master_vol = self.master_volume
-                base_stems = self.base_stems.copy()
-                current_vocal = self.current_vocal
+            # Lock-free snapshot - a single tuple read, never settings_lock
+            current_bpm, master_vol, base_stems, current_vocal, mix_view = self._state
+
+            # Mix into the preallocated buffer - no allocation in the callback
+            mixed_audio = self._mix_buf
+            if len(mixed_audio) != frame_count:
+                mixed_audio = self._mix_buf = np.zeros(frame_count, dtype=np.float32)
+                self._abs_scratch = np.zeros(frame_count, dtype=np.float32)
+
+            # Fused path: the prebuilt SoA view goes straight into the mix
+            # kernel - no per-chunk object walking or array building
+            if mix_view is not None:
+                players, arrays, positions, lengths, volumes = mix_view
+
+                _mix_kernel(arrays, positions, lengths, volumes, master_vol, mixed_audio)
+
+                # Keep the players' control-path positions in sync
+                for k, player in enumerate(players):
+                    player.position = int(positions[k])
 
-            # Mix base stems
-            mixed_audio = np.zeros(frame_count, dtype=np.float32)
+                return (mixed_audio.tobytes(), pyaudio.paContinue)
 
-            for stem_player in base_stems.values():
+            # NumPy fallback: per-stem passes with in-place ops
+            mixed_audio.fill(0)
+
+            for stem_player in base_stems:
                 stem_samples = stem_player.get_samples(frame_count, current_bpm, self.config)
-                mixed_audio += stem_samples
+                np.add(mixed_audio, stem_samples, out=mixed_audio)
 
             # Add vocal if exists
             if current_vocal:
                 vocal_samples = current_vocal.get_samples(frame_count, current_bpm, self.config)
-                mixed_audio += vocal_samples
+                np.add(mixed_audio, vocal_samples, out=mixed_audio)
 
-            # Apply master volume
-            mixed_audio *= master_vol
+            # Apply master volume (float32 scalar - avoids a hidden upcast)
+            np.multiply(mixed_audio, master_vol, out=mixed_audio)
 
             # Soft limiting to prevent clipping (más agresivo)
-            max_amp = np.max(np.abs(mixed_audio))
-            if max_amp > 0.8:
-                # Soft limiting con tanh (más suave que hard clipping)
-                mixed_audio = np.tanh(mixed_audio / max_amp) * 0.8
-            elif max_amp > 0.95:
+            scratch = self._abs_scratch
+            np.abs(mixed_audio, out=scratch)
+            max_amp = scratch.max()  # 0-d float32
+            if max_amp > np.float32(0.8):
+                # Cubic soft limit x - x³/3 (tanh-shaped but far cheaper,
+                # valid because the peak normalization keeps |x| <= 1)
+                np.divide(mixed_audio, max_amp, out=mixed_audio)
+                np.multiply(mixed_audio, mixed_audio, out=scratch)
+                np.multiply(scratch, mixed_audio, out=scratch)
+                scratch /= np.float32(3.0)
+                np.subtract(mixed_audio, scratch, out=mixed_audio)
+                np.multiply(mixed_audio, np.float32(0.8), out=mixed_audio)
+            elif max_amp > np.float32(0.95):
                 # Hard limiting extremo para prevenir distorsión
-                mixed_audio = np.clip(mixed_audio, -0.95, 0.95)
+                np.clip(mixed_audio, np.float32(-0.95), np.float32(0.95), out=mixed_audio)
+
+            if self.config.ui.show_debug_info:
+                assert mixed_audio.dtype == np.float32, mixed_audio.dtype
 
-            return (mixed_audio.astype(np.float32).tobytes(), pyaudio.paContinue)
+            return (mixed_audio.tobytes(), pyaudio.paContinue)
 
         except Exception as e:
             print(f"❌ Audio callback error: {e}")
@@ -474,6 +909,9 @@ class EnergyResponsivePerformance:
             try:
                 current_time = time.time()
 
+                # Sample the latest OSC energy value for this iteration
+                self.current_energy = self._energy_slot
+
                 # Show periodic status
                 if current_time - last_status > 30:
                     self._show_status()
@@ -535,14 +973,23 @@ class EnergyResponsivePerformance:
 
     # OSC Handlers
     def handle_energy_change(self, unused_addr, energy: float):
-        """Handle energy feedback from crowd monitoring"""
-        old_energy = self.current_energy
-        self.current_energy = max(0.0, min(1.0, float(energy)))
-
-        # Only print if significant change
-        if abs(self.current_energy - old_energy) > 0.1:
-            energy_emoji = "📉" if self.current_energy < self.energy_threshold_low else "📊" if self.current_energy < self.energy_threshold_high else "📈"
-            print(f"{energy_emoji} Energy: {old_energy:.2f} → {self.current_energy:.2f}")
+        """Handle energy feedback from crowd monitoring
+
+        Runs on the OSC thread, possibly at frame rate - so only overwrite
+        the single energy slot and let the performance loop sample it on its
+        own cadence. Intermediate values in a burst are intentionally
+        dropped; the latest one is all that matters.
+        """
+        old_energy = self._energy_slot
+        new_energy = max(0.0, min(1.0, float(energy)))
+        self._energy_slot = new_energy
+
+        # Only print on significant change, at most once per second
+        now = time.time()
+        if abs(new_energy - old_energy) > 0.1 and now - self._last_energy_print > 1.0:
+            self._last_energy_print = now
+            energy_emoji = "📉" if new_energy < self.energy_threshold_low else "📊" if new_energy < self.energy_threshold_high else "📈"
+            print(f"{energy_emoji} Energy: {old_energy:.2f} → {new_energy:.2f}")
 
     def handle_bpm_change(self, unused_addr, bpm: float):
         """Handle BPM change"""
@@ -550,13 +997,46 @@ class EnergyResponsivePerformance:
         with self.settings_lock:
             old_bpm = self.base_bpm
             self.base_bpm = bpm
+            self._publish_state()
+        self._compat_cache.clear()
+        # Prefetched/cached players were stretched for the old BPM - drop
+        # them so they reload at the new tempo
+        with self._cache_lock:
+            self._stem_lru.clear()
+        with self._pool_lock:
+            self._vocal_pool.clear()
         print(f"🎵 BPM: {old_bpm:.1f} → {bpm:.1f}")
 
+        # Stretch active stems for the new BPM on a worker thread - the audio
+        # callback keeps playing the old buffers until the cache is ready
+        if self.config.audio.enable_time_stretching:
+            worker = threading.Thread(
+                target=self._prepare_stretch_cache, args=(bpm,), daemon=True
+            )
+            worker.start()
+
+    def _prepare_stretch_cache(self, target_bpm: float):
+        """Pre-stretch all active stems for target_bpm (runs off the audio thread)"""
+        players = list(self.base_stems.values())
+        if self.current_vocal:
+            players.append(self.current_vocal)
+
+        for stem_player in players:
+            try:
+                stem_player.prepare_bpm(target_bpm, self.config)
+            except Exception as e:
+                print(f"⚠️  Could not pre-stretch {stem_player.name}: {e}")
+
+        # Republish so the mix view picks up the freshly stretched buffers
+        with self.settings_lock:
+            self._publish_state()
+
     def handle_master_volume(self, unused_addr, volume: float):
         """Handle master volume change"""
         volume = max(0.0, min(1.0, volume))
         with self.settings_lock:
             self.master_volume = volume
+            self._publish_state()
         print(f"🔊 Master Volume: {volume:.2f}")
 
     def start(self):
@@ -588,8 +1068,9 @@ class EnergyResponsivePerformance:
         print("\n🎤 Loading initial vocal...")
         self._change_vocal(force=True)
 
-        # Start monitoring loop
+        # Start monitoring loop and vocal prefetcher
         self.performance_thread.start()
+        self.prefetch_thread.start()
 
         print("\n🎉 PERFORMANCE IS LIVE!")
         print("\n🎭 CONTROLS:")